@@ -10,15 +10,15 @@ def main():
     
     key = "queue_image"
     
-    if not client.key_exists(key):
+    key_type = client.get_key_type(key)
+    if key_type == "none":
         print(f"Key '{key}' does not exist")
+        client.close()
         return
-    
-    key_type = client.get_key_type(key)
     print(f"\ntype({key}) = {key_type}")
     
     if key_type == "string":
-        value = client.string.get(key)
+        value = client.string.get_str(key)
         print(f"GET -> {value}")
     
     elif key_type == "list":
@@ -28,8 +28,10 @@ def main():
         item = client.list.lpop(key)
         print(f"LPOP -> {item}")
         
-        remaining = client.list.lrange(key, 0, -1)
-        print(f"Remaining items: {remaining}")
+        # Offset-based paging: assumes no other consumer pops from the queue meanwhile
+        print("Remaining items:")
+        for remaining in client.list.lrange_iter(key):
+            print(f"  {remaining}")
     
     elif key_type == "hash":
         hash_data = client.hash.hgetall(key)
@@ -49,8 +51,8 @@ def example_with_context_manager():
     with RedisClient.from_env(".env") as client:
         key = "queue_image"
         
-        if client.key_exists(key):
-            key_type = client.get_key_type(key)
+        key_type = client.get_key_type(key)
+        if key_type != "none":
             print(f"Key type: {key_type}")
             
             if key_type == "list":
@@ -61,15 +63,28 @@ def example_with_context_manager():
 def example_list_operations():
     with RedisClient.from_env(".env") as client:
         key = "my_queue"
-        client.list.rpush(key, "item1", "item2", "item3")
+        pipe = client.pipeline()
+        pipe.rpush(key, "item1", "item2", "item3")
+        pipe.lrange(key, 0, -1)
+        pipe.lpop(key)
+        pipe.lrange(key, 0, -1)
+        _, items, item, remaining = pipe.execute()
         print(f"Pushed 3 items to {key}")
-        items = client.list.lrange(key, 0, -1)
         print(f"All items: {items}")
-        item = client.list.lpop(key)
         print(f"Popped: {item}")
-        remaining = client.list.lrange(key, 0, -1)
         print(f"Remaining: {remaining}")
 
+def example_queue_consumer():
+    with RedisClient.from_env(".env") as client:
+        key = "queue_image"
+        while True:
+            popped = client.list.blpop(key, timeout=30)
+            if popped is None:
+                print(f"No item in {key} for 30s, stopping")
+                break
+            _, item = popped
+            print(f"Consumed: {item}")
+
 if __name__ == "__main__":
     main()
     print("\n" + "="*50)
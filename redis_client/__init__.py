@@ -6,11 +6,20 @@ Clean OOP implementation for Redis operations
 from .config import RedisConfig
 from .connection import RedisConnection
 from .client import RedisClient
+from .cluster import RedisClusterConnection, RedisClusterClient
+from .aio import (
+    AsyncRedisClient,
+    AsyncStringOperations,
+    AsyncListOperations,
+    AsyncHashOperations,
+    AsyncSetOperations
+)
 from .operations import (
     StringOperations,
     ListOperations,
     HashOperations,
     SetOperations,
+    JsonOperations,
     KeyTypeChecker
 )
 
@@ -18,11 +27,19 @@ __all__ = [
     "RedisConfig",
     "RedisConnection",
     "RedisClient",
+    "RedisClusterConnection",
+    "RedisClusterClient",
+    "AsyncRedisClient",
     "StringOperations",
     "ListOperations",
     "HashOperations",
     "SetOperations",
-    "KeyTypeChecker"
+    "JsonOperations",
+    "KeyTypeChecker",
+    "AsyncStringOperations",
+    "AsyncListOperations",
+    "AsyncHashOperations",
+    "AsyncSetOperations"
 ]
 
 __version__ = "1.0.0"
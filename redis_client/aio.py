@@ -0,0 +1,373 @@
+"""
+Redis Async Client Module
+Asyncio Redis client with organized operations
+"""
+from typing import Optional, List, Dict, Any, Set
+import redis.asyncio as aioredis
+
+from .config import RedisConfig
+from .connection import KEEPALIVE_OPTIONS, RedisConnection
+from .operations import Reply
+
+
+class AsyncStringOperations:
+    """Async operations for Redis string data type"""
+    
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+    
+    async def get(self, key: str) -> Optional[Reply]:
+        """
+        Get string value
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Raw value (bytes unless decode_responses is set) or None if key doesn't exist
+        """
+        return await self.client.get(key)
+    
+    async def get_str(self, key: str) -> Optional[str]:
+        """
+        Get string value decoded as UTF-8
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Decoded string value or None if key doesn't exist
+        """
+        value = await self.client.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+    
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        """
+        Set string value
+        
+        Args:
+            key: Redis key
+            value: String value to set
+            ex: Expiration time in seconds (optional)
+            
+        Returns:
+            True if successful
+        """
+        return await self.client.set(key, value, ex=ex)
+    
+    async def delete(self, key: str) -> int:
+        """
+        Delete key
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Number of keys deleted
+        """
+        return await self.client.delete(key)
+
+
+class AsyncListOperations:
+    """Async operations for Redis list data type"""
+    
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+    
+    async def lpush(self, key: str, *values: str) -> int:
+        """
+        Push values to the left of the list
+        
+        Args:
+            key: Redis key
+            values: Values to push
+            
+        Returns:
+            Length of list after push
+        """
+        return await self.client.lpush(key, *values)
+    
+    async def rpush(self, key: str, *values: str) -> int:
+        """
+        Push values to the right of the list
+        
+        Args:
+            key: Redis key
+            values: Values to push
+            
+        Returns:
+            Length of list after push
+        """
+        return await self.client.rpush(key, *values)
+    
+    async def lpop(self, key: str) -> Optional[Reply]:
+        """
+        Pop value from the left of the list
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Popped value or None if list is empty
+        """
+        return await self.client.lpop(key)
+    
+    async def rpop(self, key: str) -> Optional[Reply]:
+        """
+        Pop value from the right of the list
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Popped value or None if list is empty
+        """
+        return await self.client.rpop(key)
+    
+    async def lrange(self, key: str, start: int = 0, end: int = -1) -> List[Reply]:
+        """
+        Get range of values from list
+        
+        Args:
+            key: Redis key
+            start: Start index
+            end: End index (-1 for all)
+            
+        Returns:
+            List of values
+        """
+        return await self.client.lrange(key, start, end)
+    
+    async def llen(self, key: str) -> int:
+        """
+        Get length of list
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Length of list
+        """
+        return await self.client.llen(key)
+
+
+class AsyncHashOperations:
+    """Async operations for Redis hash data type"""
+    
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+    
+    async def hset(self, key: str, field: str, value: str) -> int:
+        """
+        Set hash field
+        
+        Args:
+            key: Redis key
+            field: Hash field
+            value: Field value
+            
+        Returns:
+            1 if new field, 0 if updated
+        """
+        return await self.client.hset(key, field, value)
+    
+    async def hget(self, key: str, field: str) -> Optional[Reply]:
+        """
+        Get hash field value
+        
+        Args:
+            key: Redis key
+            field: Hash field
+            
+        Returns:
+            Field value or None
+        """
+        return await self.client.hget(key, field)
+    
+    async def hgetall(self, key: str) -> Dict[Reply, Reply]:
+        """
+        Get all hash fields and values
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Dictionary of field-value pairs
+        """
+        return await self.client.hgetall(key)
+    
+    async def hdel(self, key: str, *fields: str) -> int:
+        """
+        Delete hash fields
+        
+        Args:
+            key: Redis key
+            fields: Fields to delete
+            
+        Returns:
+            Number of fields deleted
+        """
+        return await self.client.hdel(key, *fields)
+
+
+class AsyncSetOperations:
+    """Async operations for Redis set data type"""
+    
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+    
+    async def sadd(self, key: str, *members: str) -> int:
+        """
+        Add members to set
+        
+        Args:
+            key: Redis key
+            members: Members to add
+            
+        Returns:
+            Number of members added
+        """
+        return await self.client.sadd(key, *members)
+    
+    async def smembers(self, key: str) -> Set[Reply]:
+        """
+        Get all set members
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Set of members
+        """
+        return await self.client.smembers(key)
+    
+    async def srem(self, key: str, *members: str) -> int:
+        """
+        Remove members from set
+        
+        Args:
+            key: Redis key
+            members: Members to remove
+            
+        Returns:
+            Number of members removed
+        """
+        return await self.client.srem(key, *members)
+
+
+class AsyncRedisClient:
+    """
+    Asyncio counterpart of RedisClient
+    
+    Only faster than the synchronous client when independent commands are
+    awaited concurrently, e.g. ``await asyncio.gather(*(client.list.lpop(k) for k in keys))``.
+    Awaiting commands one after another still pays one round-trip each.
+    """
+    
+    def __init__(self, config: RedisConfig):
+        """
+        Initialize async Redis client
+        
+        Args:
+            config: RedisConfig instance
+        """
+        self.config = config
+        # Same limits as the sync pool: concurrent commands beyond the cap wait for a connection
+        if config.unix_socket_path:
+            pool = aioredis.BlockingConnectionPool(
+                connection_class=aioredis.UnixDomainSocketConnection,
+                path=config.unix_socket_path,
+                password=config.password,
+                decode_responses=config.decode_responses,
+                max_connections=RedisConnection.MAX_CONNECTIONS,
+                timeout=RedisConnection.POOL_TIMEOUT,
+                socket_connect_timeout=RedisConnection.SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=RedisConnection.HEALTH_CHECK_INTERVAL
+            )
+        else:
+            pool = aioredis.BlockingConnectionPool(
+                host=config.host,
+                port=config.port,
+                password=config.password,
+                decode_responses=config.decode_responses,
+                max_connections=RedisConnection.MAX_CONNECTIONS,
+                timeout=RedisConnection.POOL_TIMEOUT,
+                socket_connect_timeout=RedisConnection.SOCKET_CONNECT_TIMEOUT,
+                socket_keepalive=True,
+                socket_keepalive_options=KEEPALIVE_OPTIONS,
+                health_check_interval=RedisConnection.HEALTH_CHECK_INTERVAL
+            )
+        self._client = aioredis.Redis(connection_pool=pool)
+        
+        # Initialize operation handlers
+        self.string = AsyncStringOperations(self._client)
+        self.list = AsyncListOperations(self._client)
+        self.hash = AsyncHashOperations(self._client)
+        self.set = AsyncSetOperations(self._client)
+    
+    @classmethod
+    def from_env(cls, env_file: str = ".env", **overrides: Any) -> "AsyncRedisClient":
+        """
+        Create async Redis client from a .env file and environment variables
+        
+        Args:
+            env_file: Path to .env file
+            overrides: REDIS_ADDR, REDIS_PORT, REDIS_PASSWORD or REDIS_SOCKET_PATH overrides
+            
+        Returns:
+            AsyncRedisClient instance
+        """
+        config = RedisConfig.from_env(env_file, **overrides)
+        return cls(config)
+    
+    @property
+    def client(self) -> aioredis.Redis:
+        """Get underlying async Redis client"""
+        return self._client
+    
+    async def ping(self) -> bool:
+        """
+        Test connection to Redis server
+        
+        Returns:
+            True if connected
+        """
+        return await self._client.ping()
+    
+    async def get_key_type(self, key: str) -> str:
+        """
+        Get the type of a Redis key
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Key type as string
+        """
+        key_type = await self._client.type(key)
+        return key_type.decode() if isinstance(key_type, bytes) else key_type
+    
+    async def delete_key(self, *keys: str) -> int:
+        """
+        Delete one or more keys
+        
+        Args:
+            keys: Redis keys to delete
+            
+        Returns:
+            Number of keys deleted
+        """
+        return await self._client.delete(*keys)
+    
+    async def close(self) -> None:
+        """Close Redis connection and its connection pool"""
+        await self._client.aclose(close_connection_pool=True)
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.ping()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
@@ -2,26 +2,57 @@
 Redis Client Module
 High-level Redis client with organized operations
 """
-from typing import Optional, List, Dict, Any
+from dataclasses import astuple
+from threading import Lock
+from typing import ClassVar, Optional, List, Dict, Any, Tuple, Union
 import redis
+from redis.cluster import ClusterPipeline
 
 from .config import RedisConfig
-from .connection import RedisConnection
+from .connection import AnyRedis, RedisConnection
 from .operations import (
     KeyTypeChecker,
     StringOperations,
     ListOperations,
     HashOperations,
-    SetOperations
+    SetOperations,
+    JsonOperations
 )
 
 
+# Reads a key according to its type in a single round-trip
+GET_BY_TYPE_SCRIPT = """
+local t = redis.call('TYPE', KEYS[1])['ok']
+if t == 'string' then
+    return {t, redis.call('GET', KEYS[1])}
+elseif t == 'list' then
+    return {t, redis.call('LRANGE', KEYS[1], 0, -1)}
+elseif t == 'hash' then
+    return {t, redis.call('HGETALL', KEYS[1])}
+elseif t == 'set' then
+    return {t, redis.call('SMEMBERS', KEYS[1])}
+else
+    return {t}
+end
+"""
+
+
+def _pairs_to_dict(values: List[Any]) -> Dict[Any, Any]:
+    """Convert a flat HGETALL reply into a dictionary"""
+    return dict(zip(values[::2], values[1::2]))
+
+
 class RedisClient:
     """
     High-level Redis client with organized operations
     Provides a clean interface for Redis operations
     """
     
+    connection_class: ClassVar[type] = RedisConnection
+    _clients: ClassVar[Dict[Tuple, "RedisClient"]] = {}
+    # Guards _clients and every client's _refs
+    _clients_lock: ClassVar[Lock] = Lock()
+    
     def __init__(self, config: RedisConfig):
         """
         Initialize Redis client
@@ -30,38 +61,79 @@ class RedisClient:
             config: RedisConfig instance
         """
         self.config = config
-        self._connection = RedisConnection(config)
+        self._refs = 1
+        self._cache_key: Optional[Tuple] = None
+        self._connection = self.connection_class(config)
         self._connection.connect()
         
         # Initialize operation handlers
         self._client = self._connection.client #sudah memiliki object redis  Optional[redis_client.Redis] = None
         self.type_checker = KeyTypeChecker(self._client)
-        self.string = StringOperations(self._client)
-        self.list = ListOperations(self._client)
-        self.hash = HashOperations(self._client)
-        self.set = SetOperations(self._client)
+        self.string = StringOperations(self._client, self.type_checker)
+        self.list = ListOperations(self._client, self.type_checker)
+        self.hash = HashOperations(self._client, self.type_checker)
+        self.set = SetOperations(self._client, self.type_checker)
+        self.json = JsonOperations(self._client, self.type_checker)
+        
+        # EVAL on first call, EVALSHA afterwards
+        self._get_by_type = self._client.register_script(GET_BY_TYPE_SCRIPT)
+        # Converts the script reply for each supported key type
+        self._dispatch = {
+            "string": lambda value: value,
+            "list": lambda value: value,
+            "hash": _pairs_to_dict,
+            "set": set
+        }
     
     @classmethod
-    def from_env(cls, REDIS_ADDR: str, REDIS_PORT: int, REDIS_PASSWORD: str) -> "RedisClient":
+    def from_env(cls, env_file: str = ".env", **overrides: Any) -> "RedisClient":
         """
-        Create Redis client from environment variables
-
+        Create Redis client from a .env file and environment variables
+        
+        Clients are shared per configuration: repeated calls return the same
+        live client until every caller has closed it.
+        
         Args:
-            REDIS_ADDR: Redis address
-            REDIS_PORT: Redis port
-            REDIS_PASSWORD: Redis password
+            env_file: Path to .env file
+            overrides: REDIS_ADDR, REDIS_PORT, REDIS_PASSWORD or REDIS_SOCKET_PATH overrides
             
         Returns:
             RedisClient instance
         """
-        config = RedisConfig.from_env(REDIS_ADDR, REDIS_PORT, REDIS_PASSWORD)
-        return cls(config)
+        config = RedisConfig.from_env(env_file, **overrides)
+        key = (cls, astuple(config))
+        
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is not None:
+                client._refs += 1
+                return client
+            
+            client = cls(config)
+            client._cache_key = key
+            cls._clients[key] = client
+            return client
     
     @property
-    def client(self) -> redis.Redis:
+    def client(self) -> AnyRedis:
         """Get underlying Redis client"""
         return self._client
     
+    def pipeline(self, transaction: bool = False) -> Union[redis.client.Pipeline, ClusterPipeline]:
+        """
+        Create a pipeline to batch several commands into one round-trip
+        
+        Writes queued on the pipeline bypass the key type cache; call
+        ``type_checker.invalidate(*keys)`` for keys whose type may change.
+        
+        Args:
+            transaction: Wrap the queued commands in MULTI/EXEC
+            
+        Returns:
+            Redis pipeline instance
+        """
+        return self._client.pipeline(transaction=transaction)
+    
     def ping(self) -> bool:
         """
         Test connection to Redis server
@@ -79,7 +151,7 @@ class RedisClient:
             key: Redis key
             
         Returns:
-            Key type as string
+            Key type as string, "none" if the key doesn't exist
         """
         return self.type_checker.get_type(key)
     
@@ -105,7 +177,9 @@ class RedisClient:
         Returns:
             Number of keys deleted
         """
-        return self._client.delete(*keys)
+        result = self._client.delete(*keys)
+        self.type_checker.invalidate(*keys)
+        return result
     
     def get_value_by_type(self, key: str) -> Optional[Any]:
         """
@@ -117,23 +191,24 @@ class RedisClient:
         Returns:
             Value based on type, or None if key doesn't exist
         """
-        key_type = self.get_key_type(key)
+        result = self._get_by_type(keys=[key])
+        key_type = result[0]
+        key_type = key_type.decode() if isinstance(key_type, bytes) else key_type
         
-        if key_type == "string":
-            return self.string.get(key)
-        elif key_type == "list":
-            return self.list.lrange(key)
-        elif key_type == "hash":
-            return self.hash.hgetall(key)
-        elif key_type == "set":
-            return self.set.smembers(key)
-        elif key_type == "none":
+        if key_type == "none":
             return None
-        else:
-            return f"Unsupported type: {key_type}"
+        convert = self._dispatch.get(key_type)
+        return convert(result[1]) if convert else f"Unsupported type: {key_type}"
     
     def close(self) -> None:
-        """Close Redis connection"""
+        """Close Redis connection once no other from_env caller shares this client"""
+        with self._clients_lock:
+            self._refs = max(self._refs - 1, 0)
+            if self._refs > 0:
+                return
+            if self._cache_key is not None:
+                self._clients.pop(self._cache_key, None)
+                self._cache_key = None
         self._connection.disconnect()
     
     def __enter__(self):
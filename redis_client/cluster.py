@@ -0,0 +1,100 @@
+"""
+Redis Cluster Module
+Cluster-aware connection and client distributing keys over hash slots
+"""
+from typing import Any, ClassVar, Dict, cast
+from redis.cluster import ClusterNode, ClusterPipeline, RedisCluster
+
+try:
+    from redis.cluster import LoadBalancingStrategy
+except ImportError:  # redis-py < 5.3
+    LoadBalancingStrategy = None
+
+from .client import RedisClient
+from .connection import KEEPALIVE_OPTIONS, RedisConnection
+
+
+class RedisClusterConnection(RedisConnection):
+    """
+    Manages a Redis Cluster client connection
+    The configured host/port is used as the startup node for slot discovery
+    
+    RedisCluster filters out health_check_interval, so unlike RedisConnection
+    no periodic health checks are made; TCP keepalive detects dead sockets.
+    
+    Reads go to primaries only. Set READ_FROM_REPLICAS in a subclass to spread
+    reads over replicas, at the cost of read-your-writes: a read right after a
+    write may hit a lagging replica and return the old value or key type.
+    """
+    
+    READ_FROM_REPLICAS: ClassVar[bool] = False
+    
+    def connect(self) -> RedisCluster:
+        """
+        Establish connection to the Redis cluster
+        
+        Returns:
+            RedisCluster client instance
+            
+        Raises:
+            ValueError: If a Unix socket path is configured
+            redis.ConnectionError: If connection fails
+        """
+        if self.config.unix_socket_path:
+            raise ValueError("Redis Cluster does not support unix_socket_path, use REDIS_ADDR/REDIS_PORT")
+        
+        if self._client is None:
+            replica_kwargs: Dict[str, Any] = {}
+            if self.READ_FROM_REPLICAS:
+                if LoadBalancingStrategy is not None:
+                    replica_kwargs["load_balancing_strategy"] = LoadBalancingStrategy.ROUND_ROBIN
+                else:
+                    replica_kwargs["read_from_replicas"] = True
+            
+            self._client = RedisCluster(
+                startup_nodes=[ClusterNode(self.config.host, self.config.port)],
+                password=self.config.password,
+                decode_responses=self.config.decode_responses,
+                socket_connect_timeout=self.SOCKET_CONNECT_TIMEOUT,
+                socket_keepalive=True,
+                socket_keepalive_options=KEEPALIVE_OPTIONS,
+                **replica_kwargs
+            )
+            # Test connection
+            self._client.ping()
+        
+        return self._client
+    
+    def disconnect(self) -> None:
+        """Close connections to all cluster nodes"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class RedisClusterClient(RedisClient):
+    """
+    High-level Redis Cluster client
+    
+    Keys are distributed across nodes by CRC16 hash slot. Multi-key commands
+    (mget, mset, sunion) only work when all keys map to the same slot; use
+    hash tags like ``{user:1}:name`` to co-locate them. Non-transactional
+    pipelines may mix slots: redis-py groups the queued commands per node.
+    
+    Reads are served by primaries so writes are visible immediately; replica
+    reads are opt-in through RedisClusterConnection.READ_FROM_REPLICAS.
+    """
+    
+    connection_class: ClassVar[type] = RedisClusterConnection
+    
+    def pipeline(self, transaction: bool = False) -> ClusterPipeline:
+        """
+        Create a cluster pipeline; commands are grouped per node on execute
+        
+        Args:
+            transaction: Must be False, Redis Cluster pipelines are not transactional
+            
+        Returns:
+            Redis Cluster pipeline instance
+        """
+        return cast(ClusterPipeline, self._client.pipeline(transaction=transaction))
@@ -4,8 +4,29 @@ Handles loading and managing Redis connection configuration
 """
 import os
 from dataclasses import dataclass
-from typing import Optional
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+ENV_KEYS = ("REDIS_ADDR", "REDIS_PORT", "REDIS_PASSWORD", "REDIS_SOCKET_PATH")
+
+
+@lru_cache(maxsize=8)
+def _read_env_file(env_file: str) -> Tuple[Optional[str], ...]:
+    """
+    Parse an env file once and cache the Redis settings it defines
+    
+    Args:
+        env_file: Path to .env file
+        
+    Returns:
+        Values of ENV_KEYS, None for keys missing from the file
+    """
+    # Imported here so from_env calls given REDIS_ADDR, REDIS_PORT and REDIS_PASSWORD never load python-dotenv
+    from dotenv import dotenv_values
+    
+    values = dotenv_values(env_file)
+    return tuple(values.get(name) for name in ENV_KEYS)
 
 
 @dataclass
@@ -14,15 +35,35 @@ class RedisConfig:
     host: str
     port: int
     password: Optional[str] = None
-    decode_responses: bool = True
+    decode_responses: bool = False
+    unix_socket_path: Optional[str] = None
     
     @classmethod
-    def from_env(cls, REDIS_ADDR: str, REDIS_PORT: int, REDIS_PASSWORD: str) -> "RedisConfig":
+    def from_env(
+        cls,
+        env_file: str = ".env",
+        *,
+        REDIS_ADDR: Optional[str] = None,
+        REDIS_PORT: Optional[int] = None,
+        REDIS_PASSWORD: Optional[str] = None,
+        REDIS_SOCKET_PATH: Optional[str] = None
+    ) -> "RedisConfig":
         """
-        Load Redis configuration from environment variables
+        Load Redis configuration from a .env file and environment variables
+        
+        Each of REDIS_ADDR, REDIS_PORT and REDIS_PASSWORD is taken from its
+        override, else from the file (parsed once per path), else from the
+        process environment; the file is not read when all three are given.
+        A REDIS_ADDR or REDIS_PORT override selects TCP, so REDIS_SOCKET_PATH
+        is then only used when passed explicitly.
         
         Args:
             env_file: Path to .env file
+            REDIS_ADDR: Redis address override (optional)
+            REDIS_PORT: Redis port override (optional)
+            REDIS_PASSWORD: Redis password override (optional)
+            REDIS_SOCKET_PATH: Unix socket path override (optional), used instead
+                of REDIS_ADDR/REDIS_PORT for a co-located server
             
         Returns:
             RedisConfig instance
@@ -30,11 +71,22 @@ class RedisConfig:
         Raises:
             ValueError: If required environment variables are missing
         """
+        host, port, password, socket_path = REDIS_ADDR, REDIS_PORT, REDIS_PASSWORD, REDIS_SOCKET_PATH
+        if host is None or port is None or password is None:
+            env_host, env_port, env_password, env_socket_path = (
+                value or os.getenv(name)
+                for name, value in zip(ENV_KEYS, _read_env_file(env_file))
+            )
+            host = host if host is not None else env_host
+            port = port if port is not None else env_port
+            password = password if password is not None else env_password
+            # A host or port override selects TCP over the configured socket
+            if REDIS_ADDR is None and REDIS_PORT is None and socket_path is None:
+                socket_path = env_socket_path
         
-        host = REDIS_ADDR
-        port = REDIS_PORT
-        password = REDIS_PASSWORD
-        
+        if socket_path:
+            host = host or "localhost"
+            port = port or 6379
         if not host:
             raise ValueError("REDIS_ADDR environment variable is required")
         if not port:
@@ -48,6 +100,6 @@ class RedisConfig:
         return cls(
             host=host,
             port=port_int,
-            password=password if password else None
+            password=password if password else None,
+            unix_socket_path=socket_path if socket_path else None
         )
-
@@ -2,13 +2,41 @@
 Redis Connection Module
 Manages Redis client connection lifecycle
 """
+import socket
+import warnings
 import redis
-from typing import Optional
+from redis.cluster import RedisCluster
+from redis.utils import HIREDIS_AVAILABLE
+from typing import ClassVar, Dict, Optional, Tuple, Union
 from .config import RedisConfig
 
 
+# Standalone or cluster client; both expose the same command methods
+AnyRedis = Union[redis.Redis, RedisCluster]
+
+
+# Probe idle sockets after 60s, every 10s, give up after 3 misses
+# The options are platform specific, so only those available are set
+KEEPALIVE_OPTIONS: Dict[int, int] = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+
 class RedisConnection:
-    """Manages Redis client connection"""
+    """
+    Manages Redis client connection
+    Connection pools are shared between instances with the same configuration
+    """
+    
+    # Callers beyond the cap wait up to POOL_TIMEOUT seconds for a free connection
+    MAX_CONNECTIONS: ClassVar[int] = 32
+    POOL_TIMEOUT: ClassVar[float] = 20
+    # Only bounds connecting; a read timeout would cut off blocking pops like BLPOP
+    SOCKET_CONNECT_TIMEOUT: ClassVar[float] = 5
+    HEALTH_CHECK_INTERVAL: ClassVar[int] = 30
+    _pools: ClassVar[Dict[Tuple, redis.ConnectionPool]] = {}
     
     def __init__(self, config: RedisConfig):
         """
@@ -18,9 +46,9 @@ class RedisConnection:
             config: RedisConfig instance
         """
         self.config = config
-        self._client: Optional[redis.Redis] = None
+        self._client: Optional[AnyRedis] = None
     
-    def connect(self) -> redis.Redis:
+    def connect(self) -> AnyRedis:
         """
         Establish connection to Redis server
         
@@ -31,19 +59,64 @@ class RedisConnection:
             redis.ConnectionError: If connection fails
         """
         if self._client is None:
-            self._client = redis.Redis(
-                host=self.config.host,
-                port=self.config.port,
-                password=self.config.password,
-                decode_responses=self.config.decode_responses
-            )
+            self._client = redis.Redis(connection_pool=self._get_pool())
             # Test connection
             self._client.ping()
         
         return self._client
     
+    def _get_pool(self) -> redis.ConnectionPool:
+        """
+        Get the shared connection pool for this configuration, creating it if necessary
+        
+        Returns:
+            Redis connection pool
+        """
+        key = (
+            self.config.host,
+            self.config.port,
+            self.config.password,
+            self.config.decode_responses,
+            self.config.unix_socket_path
+        )
+        pool = self._pools.get(key)
+        if pool is None:
+            if not HIREDIS_AVAILABLE:
+                warnings.warn(
+                    "hiredis is not installed, falling back to the pure-Python RESP parser. "
+                    "Install it with `pip install hiredis` for faster reply parsing.",
+                    RuntimeWarning
+                )
+            if self.config.unix_socket_path:
+                # Skips the TCP stack for a co-located server; keepalive options are TCP only
+                pool = redis.BlockingConnectionPool(
+                    connection_class=redis.UnixDomainSocketConnection,
+                    path=self.config.unix_socket_path,
+                    password=self.config.password,
+                    decode_responses=self.config.decode_responses,
+                    max_connections=self.MAX_CONNECTIONS,
+                    timeout=self.POOL_TIMEOUT,
+                    socket_connect_timeout=self.SOCKET_CONNECT_TIMEOUT,
+                    health_check_interval=self.HEALTH_CHECK_INTERVAL
+                )
+            else:
+                pool = redis.BlockingConnectionPool(
+                    host=self.config.host,
+                    port=self.config.port,
+                    password=self.config.password,
+                    decode_responses=self.config.decode_responses,
+                    max_connections=self.MAX_CONNECTIONS,
+                    timeout=self.POOL_TIMEOUT,
+                    socket_connect_timeout=self.SOCKET_CONNECT_TIMEOUT,
+                    socket_keepalive=True,
+                    socket_keepalive_options=KEEPALIVE_OPTIONS,
+                    health_check_interval=self.HEALTH_CHECK_INTERVAL
+                )
+            pool = self._pools.setdefault(key, pool)
+        return pool
+    
     @property
-    def client(self) -> redis.Redis:
+    def client(self) -> AnyRedis:
         """
         Get Redis client, connecting if necessary
         
@@ -55,10 +128,12 @@ class RedisConnection:
         return self._client
     
     def disconnect(self) -> None:
-        """Close Redis connection"""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        """
+        Release Redis connection
+        
+        The shared connection pool is left open so other instances can reuse it
+        """
+        self._client = None
     
     def is_connected(self) -> bool:
         """
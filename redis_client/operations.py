@@ -2,24 +2,22 @@
 Redis Operations Module
 Provides high-level operations for different Redis data types
 """
-from typing import Optional, List, Dict, Any
-from abc import ABC, abstractmethod
-import redis
+from typing import Optional, List, Dict, Any, Callable, Iterator, Protocol, Set, Tuple, Union
+from threading import Lock
+from time import monotonic
 
+from .connection import AnyRedis
 
-class RedisOperation(ABC):
-    """Abstract base class for Redis operations"""
+
+# Reply values are bytes by default, str when RedisConfig.decode_responses is set
+Reply = Union[str, bytes]
+
+
+class RedisOperation(Protocol):
+    """Structural type for Redis operations"""
     
-    def __init__(self, client: redis.Redis):
-        """
-        Initialize operation with Redis client
-        
-        Args:
-            client: Redis client instance
-        """
-        self.client = client
+    client: AnyRedis
     
-    @abstractmethod
     def execute(self, key: str) -> Any:
         """
         Execute the operation
@@ -30,14 +28,30 @@ class RedisOperation(ABC):
         Returns:
             Operation result
         """
-        pass
+        ...
 
 
 class KeyTypeChecker:
-    """Utility class for checking Redis key types"""
+    """
+    Utility class for checking Redis key types
+    Results are cached for a short TTL to avoid repeated TYPE round-trips
+    """
     
-    def __init__(self, client: redis.Redis):
+    def __init__(self, client: AnyRedis, ttl: float = 0.05, max_entries: int = 1024):
+        """
+        Initialize type checker
+        
+        Args:
+            client: Redis client instance
+            ttl: Seconds a cached key type stays valid
+            max_entries: Maximum number of cached key types
+        """
         self.client = client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._type = client.type
+        self._cache: Dict[str, Tuple[float, str]] = {}
+        self._lock = Lock()
     
     def get_type(self, key: str) -> str:
         """
@@ -49,17 +63,71 @@ class KeyTypeChecker:
         Returns:
             Key type as string (string, list, set, zset, hash, none)
         """
-        key_type = self.client.type(key)
-        return key_type.decode() if isinstance(key_type, bytes) else key_type
+        cached = self._cache.get(key)
+        if cached is not None and monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        
+        key_type = self._type(key)
+        key_type = key_type.decode() if isinstance(key_type, bytes) else key_type
+        
+        with self._lock:
+            if key not in self._cache and len(self._cache) >= self.max_entries:
+                now = monotonic()
+                for stale in [k for k, (ts, _) in self._cache.items() if now - ts >= self.ttl]:
+                    del self._cache[stale]
+                if len(self._cache) >= self.max_entries:
+                    # Entries are refreshed on miss, so the oldest is the least recently fetched
+                    self._cache.pop(next(iter(self._cache)), None)
+            # Re-insert so the entry moves to the end of the eviction order
+            self._cache.pop(key, None)
+            self._cache[key] = (monotonic(), key_type)
+        return key_type
+    
+    def invalidate(self, *keys: str) -> None:
+        """
+        Drop cached types for keys that were written or deleted
+        
+        Args:
+            keys: Redis keys
+        """
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
 
 
-class StringOperations:
-    """Operations for Redis string data type"""
+class _CachedTypeOperations:
+    """Shared base for operations that invalidate the key type cache on writes"""
     
-    def __init__(self, client: redis.Redis):
+    def __init__(self, client: AnyRedis, type_checker: Optional[KeyTypeChecker] = None):
+        """
+        Initialize operation with Redis client
+        
+        Args:
+            client: Redis client instance
+            type_checker: KeyTypeChecker whose cache is invalidated on writes
+        """
         self.client = client
+        self.type_checker = type_checker
     
-    def get(self, key: str) -> Optional[str]:
+    def _invalidate(self, *keys: str) -> None:
+        """Invalidate the cached type of keys"""
+        if self.type_checker is not None:
+            self.type_checker.invalidate(*keys)
+
+
+class StringOperations(_CachedTypeOperations):
+    """Operations for Redis string data type"""
+    
+    def __init__(self, client: AnyRedis, type_checker: Optional[KeyTypeChecker] = None):
+        super().__init__(client, type_checker)
+        # Bind command methods once to skip attribute lookups per call
+        self._get = client.get
+        self._set = client.set
+        self._delete = client.delete
+        self._mget = client.mget
+        self._mset = client.mset
+    
+    def get(self, key: str) -> Optional[Reply]:
         """
         Get string value
         
@@ -67,9 +135,22 @@ class StringOperations:
             key: Redis key
             
         Returns:
-            String value or None if key doesn't exist
+            Raw value (bytes unless decode_responses is set) or None if key doesn't exist
+        """
+        return self._get(key)
+    
+    def get_str(self, key: str) -> Optional[str]:
+        """
+        Get string value decoded as UTF-8
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Decoded string value or None if key doesn't exist
         """
-        return self.client.get(key)
+        value = self._get(key)
+        return value.decode() if isinstance(value, bytes) else value
     
     def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
         """
@@ -83,7 +164,35 @@ class StringOperations:
         Returns:
             True if successful
         """
-        return self.client.set(key, value, ex=ex)
+        result = self._set(key, value, ex=ex)
+        self._invalidate(key)
+        return result
+    
+    def mget(self, keys: List[str]) -> List[Optional[Reply]]:
+        """
+        Get several string values in one atomic command
+        
+        Args:
+            keys: Redis keys
+            
+        Returns:
+            Values in key order, None for keys that don't exist
+        """
+        return self._mget(keys)
+    
+    def mset(self, mapping: Dict[str, str]) -> bool:
+        """
+        Set several string values in one atomic command
+        
+        Args:
+            mapping: Key-value pairs to set
+            
+        Returns:
+            True if successful
+        """
+        result = self._mset(mapping)
+        self._invalidate(*mapping)
+        return result
     
     def delete(self, key: str) -> int:
         """
@@ -95,14 +204,24 @@ class StringOperations:
         Returns:
             Number of keys deleted
         """
-        return self.client.delete(key)
+        result = self._delete(key)
+        self._invalidate(key)
+        return result
 
 
-class ListOperations:
+class ListOperations(_CachedTypeOperations):
     """Operations for Redis list data type"""
     
-    def __init__(self, client: redis.Redis):
-        self.client = client
+    def __init__(self, client: AnyRedis, type_checker: Optional[KeyTypeChecker] = None):
+        super().__init__(client, type_checker)
+        # Bind command methods once to skip attribute lookups per call
+        self._lpush = client.lpush
+        self._rpush = client.rpush
+        self._lpop = client.lpop
+        self._rpop = client.rpop
+        self._blpop = client.blpop
+        self._lrange = client.lrange
+        self._llen = client.llen
     
     def lpush(self, key: str, *values: str) -> int:
         """
@@ -115,7 +234,9 @@ class ListOperations:
         Returns:
             Length of list after push
         """
-        return self.client.lpush(key, *values)
+        result = self._lpush(key, *values)
+        self._invalidate(key)
+        return result
     
     def rpush(self, key: str, *values: str) -> int:
         """
@@ -128,9 +249,11 @@ class ListOperations:
         Returns:
             Length of list after push
         """
-        return self.client.rpush(key, *values)
+        result = self._rpush(key, *values)
+        self._invalidate(key)
+        return result
     
-    def lpop(self, key: str) -> Optional[str]:
+    def lpop(self, key: str) -> Optional[Reply]:
         """
         Pop value from the left of the list
         
@@ -140,9 +263,11 @@ class ListOperations:
         Returns:
             Popped value or None if list is empty
         """
-        return self.client.lpop(key)
+        result = self._lpop(key)
+        self._invalidate(key)
+        return result
     
-    def rpop(self, key: str) -> Optional[str]:
+    def rpop(self, key: str) -> Optional[Reply]:
         """
         Pop value from the right of the list
         
@@ -152,9 +277,41 @@ class ListOperations:
         Returns:
             Popped value or None if list is empty
         """
-        return self.client.rpop(key)
+        result = self._rpop(key)
+        self._invalidate(key)
+        return result
     
-    def lrange(self, key: str, start: int = 0, end: int = -1) -> List[str]:
+    def blpop(self, key: str, timeout: int = 0) -> Optional[Tuple[Reply, Reply]]:
+        """
+        Pop value from the left of the list, blocking until one is available
+        
+        Args:
+            key: Redis key
+            timeout: Seconds to wait, 0 to wait forever
+            
+        Returns:
+            Tuple of (key, value) or None if the timeout expired
+        """
+        result = self._blpop([key], timeout=timeout)
+        self._invalidate(key)
+        return result
+    
+    def lpop_many(self, key: str, count: int) -> Optional[List[Reply]]:
+        """
+        Pop up to count values from the left of the list (Redis >= 6.2)
+        
+        Args:
+            key: Redis key
+            count: Maximum number of values to pop
+            
+        Returns:
+            Popped values or None if list is empty
+        """
+        result = self._lpop(key, count=count)
+        self._invalidate(key)
+        return result
+    
+    def lrange(self, key: str, start: int = 0, end: int = -1) -> List[Reply]:
         """
         Get range of values from list
         
@@ -166,7 +323,42 @@ class ListOperations:
         Returns:
             List of values
         """
-        return self.client.lrange(key, start, end)
+        return self._lrange(key, start, end)
+    
+    def lrange_iter(self, key: str, batch: int = 1000) -> Iterator[Reply]:
+        """
+        Iterate over a list in chunks instead of fetching it in one reply
+        
+        Chunks are fetched by offset, so this is not a snapshot: if the list is
+        pushed to or popped from while iterating, items are skipped or repeated.
+        Only use it on lists that are not being modified concurrently.
+        
+        Args:
+            key: Redis key
+            batch: Number of items fetched per LRANGE call
+            
+        Returns:
+            Iterator over list values
+            
+        Raises:
+            ValueError: If batch is smaller than 1
+        """
+        # Validated here rather than in the generator so the error surfaces on call
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got: {batch}")
+        return self._lrange_chunks(key, batch)
+    
+    def _lrange_chunks(self, key: str, batch: int) -> Iterator[Reply]:
+        """Yield list values fetched batch items at a time"""
+        start = 0
+        while True:
+            chunk = self._lrange(key, start, start + batch - 1)
+            if not chunk:
+                return
+            yield from chunk
+            if len(chunk) < batch:
+                return
+            start += batch
     
     def llen(self, key: str) -> int:
         """
@@ -178,14 +370,20 @@ class ListOperations:
         Returns:
             Length of list
         """
-        return self.client.llen(key)
+        return self._llen(key)
 
 
-class HashOperations:
+class HashOperations(_CachedTypeOperations):
     """Operations for Redis hash data type"""
     
-    def __init__(self, client: redis.Redis):
-        self.client = client
+    def __init__(self, client: AnyRedis, type_checker: Optional[KeyTypeChecker] = None):
+        super().__init__(client, type_checker)
+        # Bind command methods once to skip attribute lookups per call
+        self._hset = client.hset
+        self._hget = client.hget
+        self._hgetall = client.hgetall
+        self._hdel = client.hdel
+        self._hmget = client.hmget
     
     def hset(self, key: str, field: str, value: str) -> int:
         """
@@ -199,9 +397,11 @@ class HashOperations:
         Returns:
             1 if new field, 0 if updated
         """
-        return self.client.hset(key, field, value)
+        result = self._hset(key, field, value)
+        self._invalidate(key)
+        return result
     
-    def hget(self, key: str, field: str) -> Optional[str]:
+    def hget(self, key: str, field: str) -> Optional[Reply]:
         """
         Get hash field value
         
@@ -212,9 +412,22 @@ class HashOperations:
         Returns:
             Field value or None
         """
-        return self.client.hget(key, field)
+        return self._hget(key, field)
+    
+    def hmget(self, key: str, fields: List[str]) -> List[Optional[Reply]]:
+        """
+        Get several hash field values in one atomic command
+        
+        Args:
+            key: Redis key
+            fields: Hash fields
+            
+        Returns:
+            Values in field order, None for fields that don't exist
+        """
+        return self._hmget(key, fields)
     
-    def hgetall(self, key: str) -> Dict[str, str]:
+    def hgetall(self, key: str) -> Dict[Reply, Reply]:
         """
         Get all hash fields and values
         
@@ -224,7 +437,21 @@ class HashOperations:
         Returns:
             Dictionary of field-value pairs
         """
-        return self.client.hgetall(key)
+        return self._hgetall(key)
+    
+    def hscan_iter(self, key: str, match: Optional[str] = None, count: int = 1000) -> Iterator[Tuple[Reply, Reply]]:
+        """
+        Iterate over hash fields with HSCAN instead of fetching them in one reply
+        
+        Args:
+            key: Redis key
+            match: Field name pattern (optional)
+            count: Hint for number of fields fetched per HSCAN call
+            
+        Yields:
+            Field-value pairs
+        """
+        return self.client.hscan_iter(key, match=match, count=count)
     
     def hdel(self, key: str, *fields: str) -> int:
         """
@@ -237,14 +464,22 @@ class HashOperations:
         Returns:
             Number of fields deleted
         """
-        return self.client.hdel(key, *fields)
+        result = self._hdel(key, *fields)
+        self._invalidate(key)
+        return result
 
 
-class SetOperations:
+class SetOperations(_CachedTypeOperations):
     """Operations for Redis set data type"""
     
-    def __init__(self, client: redis.Redis):
-        self.client = client
+    def __init__(self, client: AnyRedis, type_checker: Optional[KeyTypeChecker] = None):
+        super().__init__(client, type_checker)
+        # Bind command methods once to skip attribute lookups per call
+        self._sadd = client.sadd
+        self._smembers = client.smembers
+        self._srem = client.srem
+        self._sunion = client.sunion
+        self._smismember = client.smismember
     
     def sadd(self, key: str, *members: str) -> int:
         """
@@ -257,9 +492,11 @@ class SetOperations:
         Returns:
             Number of members added
         """
-        return self.client.sadd(key, *members)
+        result = self._sadd(key, *members)
+        self._invalidate(key)
+        return result
     
-    def smembers(self, key: str) -> set:
+    def smembers(self, key: str) -> Set[Reply]:
         """
         Get all set members
         
@@ -269,7 +506,49 @@ class SetOperations:
         Returns:
             Set of members
         """
-        return self.client.smembers(key)
+        return self._smembers(key)
+    
+    def sunion(self, *keys: str) -> Set[Reply]:
+        """
+        Get the union of several sets in one atomic command
+        
+        Args:
+            keys: Redis keys
+            
+        Returns:
+            Set of members
+        """
+        return self._sunion(*keys)
+    
+    def smismember(self, key: str, *members: str) -> List[bool]:
+        """
+        Check membership of several members in one command (Redis >= 6.2)
+        
+        Prefer this over ``member in client.set.smembers(key)``, which transfers
+        the whole set; only the queried members are sent and checked server-side.
+        
+        Args:
+            key: Redis key
+            members: Members to check
+            
+        Returns:
+            Membership flag per member, in the order given
+        """
+        return [bool(flag) for flag in self._smismember(key, list(members))]
+    
+    def sscan_iter(self, key: str, match: Optional[str] = None, count: int = 1000) -> Iterator[Reply]:
+        """
+        Iterate over set members with SSCAN instead of fetching them in one reply
+        
+        Args:
+            key: Redis key
+            match: Member pattern (optional)
+            count: Hint for number of members fetched per SSCAN call
+            
+        Yields:
+            Set members
+        """
+        return self.client.sscan_iter(key, match=match, count=count)
     
     def srem(self, key: str, *members: str) -> int:
         """
@@ -282,5 +561,103 @@ class SetOperations:
         Returns:
             Number of members removed
         """
-        return self.client.srem(key, *members)
+        result = self._srem(key, *members)
+        self._invalidate(key)
+        return result
+
 
+class JsonOperations(_CachedTypeOperations):
+    """
+    Operations storing JSON-serialized values
+    Uses orjson when installed, falling back to the standard json module
+    """
+    
+    def __init__(
+        self,
+        client: AnyRedis,
+        type_checker: Optional[KeyTypeChecker] = None,
+        loads: Optional[Callable[[Any], Any]] = None,
+        dumps: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Initialize JSON operations
+        
+        Args:
+            client: Redis client instance
+            type_checker: KeyTypeChecker whose cache is invalidated on writes
+            loads: Deserializer for stored values (optional)
+            dumps: Serializer for values to store (optional)
+        """
+        super().__init__(client, type_checker)
+        if loads is None or dumps is None:
+            try:
+                import orjson as json_module
+            except ImportError:
+                import json as json_module
+            loads = loads or json_module.loads
+            dumps = dumps or json_module.dumps
+        self._loads = loads
+        self._dumps = dumps
+        # Bind command methods once to skip attribute lookups per call
+        self._get = client.get
+        self._set = client.set
+        self._rpush = client.rpush
+        self._lpop = client.lpop
+    
+    def get(self, key: str) -> Any:
+        """
+        Get and deserialize a value
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Deserialized value or None if key doesn't exist
+        """
+        value = self._get(key)
+        return self._loads(value) if value is not None else None
+    
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        """
+        Serialize and set a value
+        
+        Args:
+            key: Redis key
+            value: JSON-serializable value
+            ex: Expiration time in seconds (optional)
+            
+        Returns:
+            True if successful
+        """
+        result = self._set(key, self._dumps(value), ex=ex)
+        self._invalidate(key)
+        return result
+    
+    def rpush(self, key: str, *values: Any) -> int:
+        """
+        Serialize values and push them to the right of the list
+        
+        Args:
+            key: Redis key
+            values: JSON-serializable values to push
+            
+        Returns:
+            Length of list after push
+        """
+        result = self._rpush(key, *(self._dumps(value) for value in values))
+        self._invalidate(key)
+        return result
+    
+    def lpop(self, key: str) -> Any:
+        """
+        Pop and deserialize a value from the left of the list
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Deserialized value or None if list is empty
+        """
+        value = self._lpop(key)
+        self._invalidate(key)
+        return self._loads(value) if value is not None else None